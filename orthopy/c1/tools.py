@@ -1,13 +1,11 @@
-import numpy
-
-
 def clenshaw(a, alpha, beta, t):
     """Clenshaw's algorithm for evaluating
 
     S(t) = \\sum a_k P_k(alpha, beta)(t)
 
     where P_k(alpha, beta) is the kth orthogonal polynomial defined by the
-    recurrence coefficients alpha, beta.
+    recurrence coefficients alpha, beta. `t` can be a scalar or an array of any shape;
+    the recurrence is carried out for all points at once.
 
     See <https://en.wikipedia.org/wiki/Clenshaw_algorithm> for details.
     """
@@ -15,21 +13,14 @@ def clenshaw(a, alpha, beta, t):
     assert len(beta) == n
     assert len(a) == n + 1
 
-    try:
-        b = numpy.empty((n + 1,) + t.shape)
-    except AttributeError:  # 'float' object has no attribute 'shape'
-        b = numpy.empty(n + 1)
-
-    # b[0] is unused, can be any value
-    # TODO shift the array
-    b[0] = 1.0
-
-    b[n] = a[n]
-    b[n - 1] = a[n - 1] + (t - alpha[n - 1]) * b[n]
+    # Only the two most recent values of the backward recurrence are needed, so keep
+    # them in two rolling accumulators instead of storing all n + 1 of them.
+    b2 = a[n]
+    b1 = a[n - 1] + (t - alpha[n - 1]) * b2
     for k in range(n - 2, 0, -1):
-        b[k] = a[k] + (t - alpha[k]) * b[k + 1] - beta[k + 1] * b[k + 2]
+        b1, b2 = a[k] + (t - alpha[k]) * b1 - beta[k + 1] * b2, b1
 
-    phi0 = 1.0
+    phi0 = 1
     phi1 = t - alpha[0]
 
-    return phi0 * a[0] + phi1 * b[1] - beta[1] * phi0 * b[2]
+    return phi0 * a[0] + phi1 * b1 - beta[1] * phi0 * b2
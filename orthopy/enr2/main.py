@@ -1,35 +1,63 @@
+import functools
+
 import numpy
 import sympy
 
 from ..e1r2.main import RCPhysicistNormal, RCProbabilistNormal
 from ..helpers import ProductEval, ProductEvalWithDegrees
 
+# int_{-oo}^{+oo} exp(-x^2) dx
+_SQRT_PI_SYM = sympy.sqrt(sympy.pi)
+_SQRT_PI_NUM = float(numpy.sqrt(numpy.pi))
+
+
+def _first(x):
+    """Return the first scalar entry of a (possibly nested) iterable, or None if it is
+    empty.
+    """
+    while not isinstance(x, numpy.ndarray) and hasattr(x, "__iter__"):
+        try:
+            x = next(iter(x))
+        except StopIteration:
+            return None
+    return x
+
+
+def _is_symbolic(X):
+    # Peeking at the first entry is enough to detect the common all-sympy input
+    # without boxing everything into an object array. Anything else (e.g., [0, x]) is
+    # left to the full check.
+    if not isinstance(X, numpy.ndarray) and isinstance(_first(X), sympy.Basic):
+        return True
+    return numpy.asarray(X).dtype == object
+
+
+# The recurrence coefficient objects hold no state beyond their construction
+# arguments, so they can be shared between evaluators.
+@functools.lru_cache(maxsize=4)
+def _rc(standardization, symbolic):
+    return {"probabilists": RCProbabilistNormal, "physicists": RCPhysicistNormal}[
+        standardization
+    ](symbolic)
+
 
 class Eval(ProductEval):
     def __init__(self, X, standardization, symbolic="auto"):
         if symbolic == "auto":
-            symbolic = numpy.asarray(X).dtype == sympy.Basic
+            symbolic = _is_symbolic(X)
 
-        rc = {"probabilists": RCProbabilistNormal, "physicists": RCPhysicistNormal}[
-            standardization
-        ](symbolic)
+        rc = _rc(standardization, symbolic)
 
-        sqrt = sympy.sqrt if symbolic else numpy.sqrt
-        pi = sympy.pi if symbolic else numpy.pi
-        int_1 = sqrt(pi)
+        int_1 = _SQRT_PI_SYM if symbolic else _SQRT_PI_NUM
         super().__init__(rc, int_1, X, symbolic)
 
 
 class EvalWithDegrees(ProductEvalWithDegrees):
     def __init__(self, X, standardization, symbolic="auto"):
         if symbolic == "auto":
-            symbolic = numpy.asarray(X).dtype == sympy.Basic
+            symbolic = _is_symbolic(X)
 
-        rc = {"probabilists": RCProbabilistNormal, "physicists": RCPhysicistNormal}[
-            standardization
-        ](symbolic)
+        rc = _rc(standardization, symbolic)
 
-        sqrt = sympy.sqrt if symbolic else numpy.sqrt
-        pi = sympy.pi if symbolic else numpy.pi
-        int_1 = sqrt(pi)
+        int_1 = _SQRT_PI_SYM if symbolic else _SQRT_PI_NUM
         super().__init__(rc, int_1, X, symbolic)
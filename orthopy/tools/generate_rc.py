@@ -83,7 +83,11 @@ def stieltjes(integrate, n):
             alpha[k] = integrate(t, t * pi[0] ** 2) / mu[0]
             beta[k] = mu[0] / mu[1]
 
-    return alpha, beta, int_1
+    # beta[0] is not used in the recurrence; mark it like the other generators do
+    if n > 0 and not isinstance(int_1, sympy.Basic):
+        beta[0] = math.nan
+
+    return numpy.asarray(alpha), numpy.asarray(beta), int_1
 
 
 def chebyshev(moments):
@@ -1,6 +1,7 @@
 import math
 
 import numpy
+import sympy
 from scipy.special import legendre
 
 import orthopy
@@ -20,5 +21,37 @@ def test_clenshaw(tol=1.0e-14):
     assert abs(value - ref) < tol
 
 
+def test_clenshaw_array(tol=1.0e-14):
+    n = 5
+    rc = orthopy.c1.jacobi.RecurrenceCoefficients("monic", 0, 0, symbolic=False)
+    _, alpha, beta = numpy.array([rc[k] for k in range(n)]).T
+
+    t = numpy.array([[-1.0, -0.3, 0.0], [0.2, 0.7, 1.0]])
+
+    a = numpy.ones(n + 1)
+    value = orthopy.c1.clenshaw(a, alpha, beta, t)
+
+    assert value.shape == t.shape
+    ref = numpy.sum(
+        [numpy.polyval(legendre(i, monic=True), t) for i in range(n + 1)], axis=0
+    )
+    assert numpy.all(numpy.abs(value - ref) < tol)
+
+
+def test_clenshaw_symbolic():
+    n = 5
+    rc = orthopy.c1.jacobi.RecurrenceCoefficients("monic", 0, 0, symbolic=True)
+    _, alpha, beta = numpy.array([rc[k] for k in range(n)]).T
+
+    t = sympy.Symbol("t")
+
+    a = [1] * (n + 1)
+    value = orthopy.c1.clenshaw(a, alpha, beta, t)
+
+    evaluator = orthopy.c1.legendre.Eval(t, "monic", symbolic=True)
+    ref = sum(next(evaluator) for _ in range(n + 1))
+    assert sympy.expand(value - ref) == 0
+
+
 if __name__ == "__main__":
     test_clenshaw()
@@ -65,6 +65,17 @@ def test_normality(d, standardization, n=4):
             assert _integrate_poly(val ** 2, standardization) == 1
 
 
+def test_symbolic_autodetect():
+    # The first coordinate is a plain int; the input must still be treated
+    # symbolically.
+    x = sympy.Symbol("x")
+    evaluator = orthopy.enr2.Eval([0, x], "physicists")
+    next(evaluator)
+    vals = next(evaluator)
+    assert vals[0] == 0
+    assert vals[1] == sympy.sqrt(2) * x / sympy.sqrt(sympy.pi)
+
+
 @pytest.mark.parametrize("n", [2])
 def test_show_tree(n):
     standardization = "probabilists"
@@ -21,6 +21,23 @@ def test_stieltjes():
     assert int_1 == rc.int_1
 
 
+def test_stieltjes_float(tol=1.0e-14):
+    n = 5
+    alpha0, beta0, int_1 = orthopy.tools.stieltjes(
+        lambda t, ft: float(sympy.integrate(ft, (t, -1, 1))), n
+    )
+    assert alpha0.dtype == float
+    assert beta0.dtype == float
+    assert math.isnan(beta0[0])
+
+    rc = orthopy.c1.legendre.RecurrenceCoefficients("monic", symbolic=False)
+    _, alpha1, beta1 = numpy.array([rc[k] for k in range(n)]).T
+
+    assert numpy.all(numpy.abs(alpha0 - alpha1) < tol)
+    assert numpy.all(numpy.abs(beta0[1:] - beta1[1:]) < tol)
+    assert abs(int_1 - rc.int_1) < tol
+
+
 def test_golub_welsch(tol=1.0e-14):
     """Test the custom Gauss generator with the weight function x ** 2."""
     alpha = 2.0
@@ -47,7 +64,7 @@ def test_golub_welsch(tol=1.0e-14):
     orthopy.tools.gautschi_test_3(moments, alpha, beta)
 
 
-@pytest.mark.parametrize("dtype", [numpy.float, sympy.S])
+@pytest.mark.parametrize("dtype", [float, sympy.S])
 def test_chebyshev(dtype):
     alpha = 2
 
@@ -73,7 +90,7 @@ def test_chebyshev(dtype):
         ).all()
         assert int_1 == sympy.S(2) / 3
     else:
-        assert dtype == numpy.float
+        assert dtype == float
         tol = 1.0e-14
         k = numpy.arange(2 * n)
         moments = (1.0 + (-1.0) ** k) / (k + alpha + 1)